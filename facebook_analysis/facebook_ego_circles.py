@@ -0,0 +1,274 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+import numpy as np
+import scipy.sparse as sp
+import networkx as nx
+import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+import community as community_louvain
+
+dataset_dir = os.path.join(DATA_DIR, "facebook")
+
+
+class EgoIndex:
+    """Ευρετήριο ego-δικτύων πάνω σε ένα κοινό block-diagonal CSR.
+
+    Κάθε ego k καταλαμβάνει τις γραμμές node_ptr[k]:node_ptr[k+1] του κοινού
+    πίνακα γειτνίασης (με τοπική αρίθμηση κόμβων) και τις ακμές
+    edge_ptr[k]:edge_ptr[k+1] του πίνακα indices. Οι κύκλοι (.circles)
+    αποθηκεύονται με τον ίδιο τρόπο ως sparse indicator πίνακες
+    (κύκλος × τοπικός κόμβος), οπότε κάθε ερώτημα ανά ego κοστίζει
+    O(μέγεθος ego) και όχι O(γράφος).
+    """
+
+    def __init__(self, egos, node_ptr, nodes, indptr, indices,
+                 circle_ptr, circle_names, circ_indptr, circ_indices):
+        self.egos = egos
+        self.node_ptr = node_ptr
+        self.nodes = nodes
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ptr = indptr[node_ptr]
+        self.circle_ptr = circle_ptr
+        self.circle_names = circle_names
+        self.circ_indptr = circ_indptr
+        self.circ_indices = circ_indices
+        self.position = {ego: k for k, ego in enumerate(egos)}
+
+    def __len__(self):
+        return len(self.egos)
+
+    def ego_nodes(self, k):
+        """Global ids των κόμβων του ego k, με τη σειρά της τοπικής αρίθμησης."""
+        return self.nodes[self.node_ptr[k]:self.node_ptr[k + 1]]
+
+    def ego_adjacency(self, k):
+        """Τοπικός (συμμετρικός) CSR πίνακας γειτνίασης του ego k."""
+        a, b = self.node_ptr[k], self.node_ptr[k + 1]
+        e0, e1 = self.edge_ptr[k], self.edge_ptr[k + 1]
+        indptr = self.indptr[a:b + 1] - e0
+        indices = self.indices[e0:e1] - a
+        data = np.ones(e1 - e0, dtype=np.float64)
+        return sp.csr_matrix((data, indices, indptr), shape=(b - a, b - a))
+
+    def ego_circles(self, k):
+        """Sparse indicator πίνακας (κύκλοι × τοπικοί κόμβοι) και ονόματα κύκλων."""
+        c0, c1 = self.circle_ptr[k], self.circle_ptr[k + 1]
+        n = self.node_ptr[k + 1] - self.node_ptr[k]
+        m0, m1 = self.circ_indptr[c0], self.circ_indptr[c1]
+        indptr = self.circ_indptr[c0:c1 + 1] - m0
+        indices = self.circ_indices[m0:m1]
+        data = np.ones(m1 - m0, dtype=np.float64)
+        C = sp.csr_matrix((data, indices, indptr), shape=(c1 - c0, n))
+        return C, self.circle_names[c0:c1]
+
+    def ego_graph(self, k):
+        """Το ego k ως nx.Graph με global ids κόμβων."""
+        G = nx.from_scipy_sparse_array(self.ego_adjacency(k))
+        return nx.relabel_nodes(G, dict(enumerate(self.ego_nodes(k).tolist())))
+
+
+def _read_edges(path):
+    if os.path.getsize(path) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    edges = np.loadtxt(path, dtype=np.int64, ndmin=2)
+    return edges.reshape(-1, 2)
+
+
+def _read_circles(path):
+    circles = []
+    if not os.path.exists(path):
+        return circles
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                circles.append((parts[0], np.array(parts[1:], dtype=np.int64)))
+    return circles
+
+
+def build_ego_index(dataset_dir):
+    """Φόρτωση όλων των <ego>.edges / <ego>.circles σε ένα EgoIndex."""
+    egos = sorted(int(fname[:-len(".edges")]) for fname in os.listdir(dataset_dir)
+                  if fname.endswith(".edges"))
+
+    node_ptr, edge_ptr = [0], [0]
+    circle_ptr, circ_ptr = [0], [0]
+    nodes, indices, degrees = [], [], []
+    circle_names, circ_indices = [], []
+
+    for ego in egos:
+        edges = _read_edges(os.path.join(dataset_dir, f"{ego}.edges"))
+        circles = _read_circles(os.path.join(dataset_dir, f"{ego}.circles"))
+
+        # Τοπική αρίθμηση: κόμβοι των ακμών και των κύκλων του ego
+        members = [edges.ravel()] + [m for _, m in circles]
+        local_nodes = np.unique(np.concatenate(members))
+        n = len(local_nodes)
+
+        # Συμμετρικός τοπικός πίνακας χωρίς διπλές ακμές και self-loops
+        u = np.searchsorted(local_nodes, edges[:, 0])
+        v = np.searchsorted(local_nodes, edges[:, 1])
+        keep = u != v
+        rows = np.concatenate([u[keep], v[keep]])
+        cols = np.concatenate([v[keep], u[keep]])
+        A = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+        A.sum_duplicates()
+        A.sort_indices()
+
+        nodes.append(local_nodes)
+        indices.append(A.indices.astype(np.int64) + node_ptr[-1])
+        degrees.append(np.diff(A.indptr))
+        node_ptr.append(node_ptr[-1] + n)
+        edge_ptr.append(edge_ptr[-1] + A.nnz)
+
+        for name, members in circles:
+            local = np.unique(np.searchsorted(local_nodes, members))
+            circle_names.append(name)
+            circ_indices.append(local)
+            circ_ptr.append(circ_ptr[-1] + len(local))
+        circle_ptr.append(circle_ptr[-1] + len(circles))
+
+    def _cat(arrays):
+        return np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)
+
+    indptr = np.concatenate([[0], np.cumsum(_cat(degrees))]).astype(np.int64)
+    return EgoIndex(
+        egos=np.array(egos, dtype=np.int64),
+        node_ptr=np.array(node_ptr, dtype=np.int64),
+        nodes=_cat(nodes),
+        indptr=indptr,
+        indices=_cat(indices),
+        circle_ptr=np.array(circle_ptr, dtype=np.int64),
+        circle_names=circle_names,
+        circ_indptr=np.array(circ_ptr, dtype=np.int64),
+        circ_indices=_cat(circ_indices),
+    )
+
+
+def circle_overlap_scores(C, labels):
+    """Σύγκριση διαμέρισης Louvain με τους κύκλους (vectorized).
+
+    C: sparse indicator (κύκλοι × κόμβοι), labels: κοινότητα ανά κόμβο.
+    Επιστρέφει balanced best-match Jaccard και F1 (μέσος όρος των δύο
+    κατευθύνσεων κύκλος→κοινότητα και κοινότητα→κύκλος).
+    """
+    n_circ, n = C.shape
+    if n_circ == 0 or n == 0:
+        return np.nan, np.nan
+
+    _, labels = np.unique(labels, return_inverse=True)
+    P = sp.csr_matrix((np.ones(n), (labels, np.arange(n))), shape=(labels.max() + 1, n))
+
+    overlap = (C @ P.T).toarray()
+    c_size = np.asarray(C.sum(axis=1)).ravel()[:, None]
+    p_size = np.asarray(P.sum(axis=1)).ravel()[None, :]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        jaccard = np.nan_to_num(overlap / (c_size + p_size - overlap))
+        f1 = np.nan_to_num(2 * overlap / (c_size + p_size))
+
+    def _balanced(M):
+        return 0.5 * (M.max(axis=1).mean() + M.max(axis=0).mean())
+
+    return _balanced(jaccard), _balanced(f1)
+
+
+def analyze_ego(task):
+    """Κεντρικότητες, Louvain και σκορ κύκλων για ένα ego (τρέχει σε worker)."""
+    ego, global_nodes, A, C, seed = task
+    G = nx.from_scipy_sparse_array(A)
+
+    deg_cent = nx.degree_centrality(G)
+    btw_cent = nx.betweenness_centrality(G, normalized=True)
+    clo_cent = nx.closeness_centrality(G)
+    try:
+        eig_cent = nx.eigenvector_centrality(G, max_iter=100, tol=1e-06)
+    except (nx.PowerIterationFailedConvergence, nx.NetworkXPointlessConcept):
+        eig_cent = dict.fromkeys(G, np.nan)
+    pr = nx.pagerank(G, alpha=0.85, tol=1e-06)
+
+    n = G.number_of_nodes()
+    if G.number_of_edges() > 0:
+        partition = community_louvain.best_partition(G, random_state=seed)
+        modularity = community_louvain.modularity(partition, G)
+    else:
+        partition = {i: i for i in range(n)}
+        modularity = np.nan
+    labels = np.array([partition[i] for i in range(n)], dtype=np.int64)
+
+    jaccard, f1 = circle_overlap_scores(C, labels)
+
+    def _as_array(d):
+        return np.array([d[i] for i in range(n)], dtype=np.float64)
+
+    return {
+        "ego": ego,
+        "nodes": global_nodes,
+        "num_edges": G.number_of_edges(),
+        "num_circles": C.shape[0],
+        "centralities": {
+            "Degree": _as_array(deg_cent),
+            "Betweenness": _as_array(btw_cent),
+            "Closeness": _as_array(clo_cent),
+            "Eigenvector": _as_array(eig_cent),
+            "PageRank": _as_array(pr),
+        },
+        "labels": labels,
+        "num_comms": len(np.unique(labels)),
+        "modularity": modularity,
+        "jaccard": jaccard,
+        "f1": f1,
+    }
+
+
+def analyze_all_egos(index, seed=42, max_workers=None):
+    """Batch ανάλυση όλων των egos παράλληλα (μεγαλύτερα egos πρώτα)."""
+    sizes = np.diff(index.node_ptr)
+    order = np.argsort(-sizes, kind="stable")
+    tasks = [
+        (int(index.egos[k]), index.ego_nodes(k), index.ego_adjacency(k),
+         index.ego_circles(k)[0], seed)
+        for k in order
+    ]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(analyze_ego, tasks))
+    return sorted(results, key=lambda r: r["ego"])
+
+
+if __name__ == "__main__":
+    index = build_ego_index(dataset_dir)
+    print(f"Φορτώθηκαν: {len(index)} ego-δίκτυα, "
+          f"{len(index.nodes):,} (ego, κόμβος) εγγραφές, "
+          f"{len(index.indices) // 2:,} ακμές, "
+          f"{len(index.circle_names):,} κύκλοι")
+
+    results = analyze_all_egos(index)
+
+    print(f"\n{'Ego':>6} {'Κόμβοι':>7} {'Ακμές':>7} {'Κύκλοι':>7} {'Κοιν.':>6} "
+          f"{'Modul.':>7} {'Jaccard':>8} {'F1':>6}  Top PageRank")
+    for r in results:
+        pr = r["centralities"]["PageRank"]
+        top = r["nodes"][np.argmax(pr)] if len(pr) else "-"
+        print(f"{r['ego']:>6} {len(r['nodes']):>7} {r['num_edges']:>7} "
+              f"{r['num_circles']:>7} {r['num_comms']:>6} "
+              f"{r['modularity']:>7.3f} {r['jaccard']:>8.3f} {r['f1']:>6.3f}  User {top}")
+
+    # Ταύτιση Louvain κοινοτήτων με κύκλους ανά ego
+    scored = [r for r in results if r["num_circles"] > 0]
+    if scored:
+        egos = [str(r["ego"]) for r in scored]
+        x = np.arange(len(scored))
+        plt.figure(figsize=(8, 4))
+        plt.bar(x - 0.2, [r["jaccard"] for r in scored], width=0.4, label="Jaccard")
+        plt.bar(x + 0.2, [r["f1"] for r in scored], width=0.4, label="F1")
+        plt.xticks(x, egos, rotation=45, ha='right')
+        plt.title("Louvain κοινότητες vs Κύκλοι ανά Ego")
+        plt.xlabel("Ego")
+        plt.ylabel("Balanced best-match score")
+        plt.legend()
+        plt.tight_layout()
+        plt.show()